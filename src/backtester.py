@@ -6,7 +6,7 @@ import questionary
 
 import matplotlib.pyplot as plt
 import pandas as pd
-from colorama import Fore, Style, init
+from colorama import Fore, Style, just_fix_windows_console
 import numpy as np
 import itertools
 
@@ -24,7 +24,8 @@ from src.utils.display import print_backtest_results, format_backtest_row
 from typing_extensions import Callable
 from src.utils.ollama import ensure_ollama_and_model
 
-init(autoreset=True)
+# Enable ANSI handling on legacy Windows consoles without wrapping stdout
+just_fix_windows_console()
 
 
 class Backtester:
@@ -56,7 +56,8 @@ class LLMModel(BaseModel):
         if self.is_ollama():
             return "llama3" in self.model_name or "neural-chat" in self.model_name
         # OpenRouter models generally support JSON mode
-        if self.provider == ModelProvider.OPENROUTER:
+        # (identity check is safe: pydantic coerces provider to a ModelProvider member)
+        if self.provider is ModelProvider.OPENROUTER:
             return True
         return True
 
@@ -70,7 +71,7 @@ class LLMModel(BaseModel):
 
     def is_ollama(self) -> bool:
         """Check if the model is an Ollama model"""
-        return self.provider == ModelProvider.OLLAMA
+        return self.provider is ModelProvider.OLLAMA
 
 
 # Load models from JSON file
@@ -111,10 +112,18 @@ LLM_ORDER = [model.to_choice_tuple() for model in AVAILABLE_MODELS]
 OLLAMA_LLM_ORDER = [model.to_choice_tuple() for model in OLLAMA_MODELS]
 
 
+# Precomputed (model_name, provider value) -> model map so get_model_info is a
+# dict lookup instead of rescanning the model lists on every LLM call
+MODEL_INFO_BY_KEY = {}
+for _model in AVAILABLE_MODELS + OLLAMA_MODELS:
+    MODEL_INFO_BY_KEY.setdefault((_model.model_name, _model.provider.value), _model)
+
+
 def get_model_info(model_name: str, model_provider: str) -> LLMModel | None:
     """Get model information by model_name"""
-    all_models = AVAILABLE_MODELS + OLLAMA_MODELS
-    return next((model for model in all_models if model.model_name == model_name and model.provider == model_provider), None)
+    if isinstance(model_provider, ModelProvider):
+        model_provider = model_provider.value
+    return MODEL_INFO_BY_KEY.get((model_name, model_provider))
 
 
 def get_models_list():
@@ -3,7 +3,7 @@ import sys
 from dotenv import load_dotenv
 from langchain_core.messages import HumanMessage
 from langgraph.graph import END, StateGraph
-from colorama import Fore, Style, init
+from colorama import Fore, Style, just_fix_windows_console
 import questionary
 from src.agents.portfolio_manager import portfolio_management_agent
 from src.agents.risk_manager import risk_management_agent
@@ -23,7 +23,8 @@ import json
 # Load environment variables from .env file
 load_dotenv()
 
-init(autoreset=True)
+# Enable ANSI handling on legacy Windows consoles without wrapping stdout
+just_fix_windows_console()
 
 
 def parse_hedge_fund_response(response):
@@ -1,17 +1,192 @@
 from colorama import Fore, Style
-from tabulate import tabulate
 from .analysts import ANALYST_ORDER
-import os
 import json
-
-
-def sort_agent_signals(signals):
-    """Sort agent signals in a consistent order."""
-    # Create order mapping from ANALYST_ORDER
-    analyst_order = {display: idx for idx, (display, _) in enumerate(ANALYST_ORDER)}
-    analyst_order["Risk Management"] = len(ANALYST_ORDER)  # Add Risk Management at the end
-
-    return sorted(signals, key=lambda x: analyst_order.get(x[0], 999))
+import re
+import sys
+import textwrap
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Reasoning blobs above this size skip textwrap in favor of the rfind-based fast path
+LONG_TEXT_THRESHOLD = 4096
+
+# Above this many rows, the backtest table skips tabulate's multi-pass layout
+# in favor of the single-pass streaming renderer below
+LARGE_TABLE_THRESHOLD = 500
+
+ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+# Display-name -> sort-order map built once at import; Risk Management sorts last.
+# The lookup tables below are read-only, so they are frozen behind
+# MappingProxyType to rule out accidental cross-call mutation.
+ANALYST_ORDER_MAP = {display: idx for idx, (display, _) in enumerate(ANALYST_ORDER)}
+ANALYST_ORDER_MAP["Risk Management"] = len(ANALYST_ORDER)
+ANALYST_ORDER_MAP = MappingProxyType(ANALYST_ORDER_MAP)
+
+# Color lookup tables built once at import instead of per row
+SIGNAL_COLORS = MappingProxyType({
+    "BULLISH": Fore.GREEN,
+    "BEARISH": Fore.RED,
+    "NEUTRAL": Fore.YELLOW,
+})
+ACTION_COLORS = MappingProxyType({
+    "BUY": Fore.GREEN,
+    "SELL": Fore.RED,
+    "HOLD": Fore.YELLOW,
+    "COVER": Fore.GREEN,
+    "SHORT": Fore.RED,
+})
+# The backtest table renders HOLD in white rather than yellow
+BACKTEST_ACTION_COLORS = MappingProxyType({
+    "BUY": Fore.GREEN,
+    "COVER": Fore.GREEN,
+    "SELL": Fore.RED,
+    "SHORT": Fore.RED,
+    "HOLD": Fore.WHITE,
+})
+
+
+@lru_cache(maxsize=256)
+def wrap_text(text: str, width: int = 60) -> str:
+    """Wrap text at the given width, keeping whole words together.
+
+    Cached on the raw string: the portfolio manager's reasoning is wrapped
+    once per ticker decision and again for the summary, so repeats are common.
+    """
+    if not text:
+        return ""
+    # Text that already fits on one line needs no wrap pass at all
+    if len(text) <= width:
+        return text
+    if len(text) > LONG_TEXT_THRESHOLD:
+        return _wrap_long_text(text, width)
+    return "\n".join(textwrap.wrap(text, width=width, break_long_words=False, break_on_hyphens=False))
+
+
+def _wrap_long_text(text: str, width: int) -> str:
+    """Greedy wrap for very long text using str.rfind to jump a line at a time."""
+    # Collapse whitespace once up front so the line scan only has to handle single spaces
+    text = " ".join(text.split())
+    lines = []
+    i = 0
+    length = len(text)
+    while i < length:
+        j = i + width
+        if j >= length:
+            lines.append(text[i:])
+            break
+        k = text.rfind(" ", i, j + 1)
+        if k <= i:
+            # No space within the width; let the over-long word run past it
+            k = text.find(" ", j)
+            if k == -1:
+                lines.append(text[i:])
+                break
+        lines.append(text[i:k])
+        i = k + 1
+    return "\n".join(lines)
+
+
+RESET = Style.RESET_ALL
+
+# Headers and alignment for the backtest ticker table, shared by both renderers
+BACKTEST_TABLE_HEADERS = [
+    "Date",
+    "Ticker",
+    "Action",
+    "Quantity",
+    "Price",
+    "Long Shares",
+    "Short Shares",
+    "Position Value",
+    "Bullish",
+    "Bearish",
+    "Neutral",
+]
+BACKTEST_TABLE_COLALIGN = (
+    "left",    # Date
+    "left",    # Ticker
+    "center",  # Action
+    "right",   # Quantity
+    "right",   # Price
+    "right",   # Long Shares
+    "right",   # Short Shares
+    "right",   # Position Value
+    "right",   # Bullish
+    "right",   # Bearish
+    "right",   # Neutral
+)
+
+
+@lru_cache(maxsize=8192)
+def visible_len(cell: str) -> int:
+    """Display width of a cell with any ANSI color codes stripped.
+
+    Cached because redraws measure the same accumulated cells every frame,
+    and colorize() means repeated values share the exact same string.
+    """
+    return len(ANSI_ESCAPE_RE.sub("", cell))
+
+
+def render_grid(headers: list, rows: list, colalign: tuple) -> str:
+    """Render a grid table in a single pass for row counts where tabulate's
+    multi-pass layout gets expensive. Widths are measured once per cell with
+    the ANSI codes stripped, then rows are emitted with plain padding."""
+    # Bound locally: resolved once instead of one global lookup per cell
+    vlen = visible_len
+    widths = [vlen(h) for h in headers]
+    for row in rows:
+        for i, cell in enumerate(row):
+            w = vlen(cell)
+            if w > widths[i]:
+                widths[i] = w
+
+    def pad(cell, i):
+        fill = widths[i] - vlen(cell)
+        align = colalign[i]
+        if align == "right":
+            return " " * fill + cell
+        if align == "center":
+            left = fill // 2
+            return " " * left + cell + " " * (fill - left)
+        return cell + " " * fill
+
+    border = "+" + "+".join("-" * (w + 2) for w in widths) + "+"
+    header_border = "+" + "+".join("=" * (w + 2) for w in widths) + "+"
+
+    lines = [border, "| " + " | ".join(pad(h, i) for i, h in enumerate(headers)) + " |", header_border]
+    for row in rows:
+        lines.append("| " + " | ".join(pad(cell, i) for i, cell in enumerate(row)) + " |")
+        lines.append(border)
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=4096)
+def colorize(color: str, text: str) -> str:
+    """Build a colored cell, caching repeats of the same (color, text) pair."""
+    return color + text + RESET
+
+
+def format_reasoning_dict(reasoning: dict) -> str:
+    """Serialize a reasoning dict for display, using orjson when available."""
+    if not reasoning:
+        return ""
+    if orjson is not None:
+        return orjson.dumps(reasoning, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(reasoning, indent=2)
+
+
+@lru_cache(maxsize=None)
+def agent_display_name(agent: str) -> str:
+    """Convert an agent key like 'warren_buffett_agent' to a display-friendly name."""
+    return agent.replace("_agent", "").replace("_", " ").title()
 
 
 def print_trading_output(result: dict) -> None:
@@ -21,36 +196,52 @@ def print_trading_output(result: dict) -> None:
     Args:
         result (dict): Dictionary containing decisions and analyst signals for multiple tickers
     """
+    # Imported lazily so merely importing this module stays cheap; after the
+    # first call this is just a sys.modules lookup
+    from tabulate import tabulate
+
     decisions = result.get("decisions")
     if not decisions:
         print(f"{Fore.RED}No trading decisions available{Style.RESET_ALL}")
         return
 
+    # Build ticker-invariant strings once instead of once per ticker
+    agent_table_headers = [f"{Fore.WHITE}Agent", "Signal", "Confidence", "Reasoning"]
+    separator = f"{Fore.WHITE}{Style.BRIGHT}{'=' * 50}{Style.RESET_ALL}"
+
+    # Collected during the ticker loop so decisions is only traversed once
+    portfolio_data = []
+    portfolio_manager_reasoning = None
+
+    # Invert analyst_signals once so each ticker gets direct lookups instead of
+    # re-scanning every agent's signal dict
+    signals_by_ticker = {}
+    for agent, signals in result.get("analyst_signals", {}).items():
+        # Skip Risk Management agent in the signals section
+        if agent == "risk_management_agent":
+            continue
+        for t, signal in signals.items():
+            signals_by_ticker.setdefault(t, []).append((agent, signal))
+
+    # Bound locally so the per-signal loop below does LOAD_FAST lookups
+    signal_color_get = SIGNAL_COLORS.get
+
     # Print decisions for each ticker
     for ticker, decision in decisions.items():
-        print(f"\n{Fore.WHITE}{Style.BRIGHT}Analysis for {Fore.CYAN}{ticker}{Style.RESET_ALL}")
-        print(f"{Fore.WHITE}{Style.BRIGHT}{'=' * 50}{Style.RESET_ALL}")
+        # Accumulate the whole section and emit it with a single write below
+        buf = [
+            f"\n{Fore.WHITE}{Style.BRIGHT}Analysis for {Fore.CYAN}{ticker}{Style.RESET_ALL}\n",
+            separator + "\n",
+        ]
 
         # Prepare analyst signals table for this ticker
         table_data = []
-        for agent, signals in result.get("analyst_signals", {}).items():
-            if ticker not in signals:
-                continue
-                
-            # Skip Risk Management agent in the signals section
-            if agent == "risk_management_agent":
-                continue
-
-            signal = signals[ticker]
-            agent_name = agent.replace("_agent", "").replace("_", " ").title()
+        for agent, signal in signals_by_ticker.get(ticker, ()):
+            agent_name = agent_display_name(agent)
             signal_type = signal.get("signal", "").upper()
             confidence = signal.get("confidence", 0)
 
-            signal_color = {
-                "BULLISH": Fore.GREEN,
-                "BEARISH": Fore.RED,
-                "NEUTRAL": Fore.YELLOW,
-            }.get(signal_type, Fore.WHITE)
+            signal_color = signal_color_get(signal_type, Fore.WHITE)
             
             # Get reasoning if available
             reasoning_str = ""
@@ -62,81 +253,63 @@ def print_trading_output(result: dict) -> None:
                     reasoning_str = reasoning
                 elif isinstance(reasoning, dict):
                     # Convert dict to string representation
-                    reasoning_str = json.dumps(reasoning, indent=2)
+                    reasoning_str = format_reasoning_dict(reasoning)
                 else:
                     # Convert any other type to string
                     reasoning_str = str(reasoning)
                 
                 # Wrap long reasoning text to make it more readable
-                wrapped_reasoning = ""
-                current_line = ""
                 # Use a fixed width of 60 characters to match the table column width
-                max_line_length = 60
-                for word in reasoning_str.split():
-                    if len(current_line) + len(word) + 1 > max_line_length:
-                        wrapped_reasoning += current_line + "\n"
-                        current_line = word
-                    else:
-                        if current_line:
-                            current_line += " " + word
-                        else:
-                            current_line = word
-                if current_line:
-                    wrapped_reasoning += current_line
-                
-                reasoning_str = wrapped_reasoning
+                reasoning_str = wrap_text(reasoning_str, 60)
 
+            # Pair each row with its sort order so sorting needs no per-row lookup
             table_data.append(
-                [
-                    f"{Fore.CYAN}{agent_name}{Style.RESET_ALL}",
-                    f"{signal_color}{signal_type}{Style.RESET_ALL}",
-                    f"{Fore.WHITE}{confidence}%{Style.RESET_ALL}",
-                    f"{Fore.WHITE}{reasoning_str}{Style.RESET_ALL}",
-                ]
+                (
+                    ANALYST_ORDER_MAP.get(agent_name, 999),
+                    [
+                        f"{Fore.CYAN}{agent_name}{Style.RESET_ALL}",
+                        f"{signal_color}{signal_type}{Style.RESET_ALL}",
+                        f"{Fore.WHITE}{confidence}%{Style.RESET_ALL}",
+                        f"{Fore.WHITE}{reasoning_str}{Style.RESET_ALL}",
+                    ],
+                )
             )
 
         # Sort the signals according to the predefined order
-        table_data = sort_agent_signals(table_data)
+        table_data = [row for _, row in sorted(table_data, key=itemgetter(0))]
 
-        print(f"\n{Fore.WHITE}{Style.BRIGHT}AGENT ANALYSIS:{Style.RESET_ALL} [{Fore.CYAN}{ticker}{Style.RESET_ALL}]")
-        print(
+        buf.append(f"\n{Fore.WHITE}{Style.BRIGHT}AGENT ANALYSIS:{Style.RESET_ALL} [{Fore.CYAN}{ticker}{Style.RESET_ALL}]\n")
+        buf.append(
             tabulate(
                 table_data,
-                headers=[f"{Fore.WHITE}Agent", "Signal", "Confidence", "Reasoning"],
+                headers=agent_table_headers,
                 tablefmt="grid",
                 colalign=("left", "center", "right", "left"),
             )
+            + "\n"
         )
 
         # Print Trading Decision Table
         action = decision.get("action", "").upper()
-        action_color = {
-            "BUY": Fore.GREEN,
-            "SELL": Fore.RED,
-            "HOLD": Fore.YELLOW,
-            "COVER": Fore.GREEN,
-            "SHORT": Fore.RED,
-        }.get(action, Fore.WHITE)
+        action_color = ACTION_COLORS.get(action, Fore.WHITE)
+
+        # Capture the portfolio summary row and manager reasoning for the final section
+        portfolio_data.append(
+            [
+                f"{Fore.CYAN}{ticker}{Style.RESET_ALL}",
+                f"{action_color}{action}{Style.RESET_ALL}",
+                f"{action_color}{decision.get('quantity')}{Style.RESET_ALL}",
+                f"{Fore.WHITE}{decision.get('confidence'):.1f}%{Style.RESET_ALL}",
+            ]
+        )
+        if portfolio_manager_reasoning is None and decision.get("reasoning"):
+            portfolio_manager_reasoning = decision.get("reasoning")
 
         # Get reasoning and format it
         reasoning = decision.get("reasoning", "")
         # Wrap long reasoning text to make it more readable
-        wrapped_reasoning = ""
-        if reasoning:
-            current_line = ""
-            # Use a fixed width of 60 characters to match the table column width
-            max_line_length = 60
-            for word in reasoning.split():
-                if len(current_line) + len(word) + 1 > max_line_length:
-                    wrapped_reasoning += current_line + "\n"
-                    current_line = word
-                else:
-                    if current_line:
-                        current_line += " " + word
-                    else:
-                        current_line = word
-            if current_line:
-                wrapped_reasoning += current_line
+        # Use a fixed width of 60 characters to match the table column width
+        wrapped_reasoning = wrap_text(reasoning, 60)
 
         decision_data = [
             ["Action", f"{action_color}{action}{Style.RESET_ALL}"],
@@ -148,50 +321,26 @@ def print_trading_output(result: dict) -> None:
             ["Reasoning", f"{Fore.WHITE}{wrapped_reasoning}{Style.RESET_ALL}"],
         ]
         
-        print(f"\n{Fore.WHITE}{Style.BRIGHT}TRADING DECISION:{Style.RESET_ALL} [{Fore.CYAN}{ticker}{Style.RESET_ALL}]")
-        print(tabulate(decision_data, tablefmt="grid", colalign=("left", "left")))
+        buf.append(f"\n{Fore.WHITE}{Style.BRIGHT}TRADING DECISION:{Style.RESET_ALL} [{Fore.CYAN}{ticker}{Style.RESET_ALL}]\n")
+        buf.append(tabulate(decision_data, tablefmt="grid", colalign=("left", "left")) + "\n")
+        sys.stdout.write("".join(buf))
 
     # Print Portfolio Summary
-    print(f"\n{Fore.WHITE}{Style.BRIGHT}PORTFOLIO SUMMARY:{Style.RESET_ALL}")
-    portfolio_data = []
-    
-    # Extract portfolio manager reasoning (common for all tickers)
-    portfolio_manager_reasoning = None
-    for ticker, decision in decisions.items():
-        if decision.get("reasoning"):
-            portfolio_manager_reasoning = decision.get("reasoning")
-            break
-            
-    for ticker, decision in decisions.items():
-        action = decision.get("action", "").upper()
-        action_color = {
-            "BUY": Fore.GREEN,
-            "SELL": Fore.RED,
-            "HOLD": Fore.YELLOW,
-            "COVER": Fore.GREEN,
-            "SHORT": Fore.RED,
-        }.get(action, Fore.WHITE)
-        portfolio_data.append(
-            [
-                f"{Fore.CYAN}{ticker}{Style.RESET_ALL}",
-                f"{action_color}{action}{Style.RESET_ALL}",
-                f"{action_color}{decision.get('quantity')}{Style.RESET_ALL}",
-                f"{Fore.WHITE}{decision.get('confidence'):.1f}%{Style.RESET_ALL}",
-            ]
-        )
+    buf = [f"\n{Fore.WHITE}{Style.BRIGHT}PORTFOLIO SUMMARY:{Style.RESET_ALL}\n"]
 
     headers = [f"{Fore.WHITE}Ticker", "Action", "Quantity", "Confidence"]
     
     # Print the portfolio summary table
-    print(
+    buf.append(
         tabulate(
             portfolio_data,
             headers=headers,
             tablefmt="grid",
             colalign=("left", "center", "right", "right"),
         )
+        + "\n"
     )
-    
+
     # Print Portfolio Manager's reasoning if available
     if portfolio_manager_reasoning:
         # Handle different types of reasoning (string, dict, etc.)
@@ -200,110 +349,91 @@ def print_trading_output(result: dict) -> None:
             reasoning_str = portfolio_manager_reasoning
         elif isinstance(portfolio_manager_reasoning, dict):
             # Convert dict to string representation
-            reasoning_str = json.dumps(portfolio_manager_reasoning, indent=2)
+            reasoning_str = format_reasoning_dict(portfolio_manager_reasoning)
         else:
             # Convert any other type to string
             reasoning_str = str(portfolio_manager_reasoning)
             
         # Wrap long reasoning text to make it more readable
-        wrapped_reasoning = ""
-        current_line = ""
         # Use a fixed width of 60 characters to match the table column width
-        max_line_length = 60
-        for word in reasoning_str.split():
-            if len(current_line) + len(word) + 1 > max_line_length:
-                wrapped_reasoning += current_line + "\n"
-                current_line = word
-            else:
-                if current_line:
-                    current_line += " " + word
-                else:
-                    current_line = word
-        if current_line:
-            wrapped_reasoning += current_line
-            
-        print(f"\n{Fore.WHITE}{Style.BRIGHT}Portfolio Strategy:{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}{wrapped_reasoning}{Style.RESET_ALL}")
+        wrapped_reasoning = wrap_text(reasoning_str, 60)
+
+        buf.append(f"\n{Fore.WHITE}{Style.BRIGHT}Portfolio Strategy:{Style.RESET_ALL}\n")
+        buf.append(f"{Fore.CYAN}{wrapped_reasoning}{Style.RESET_ALL}\n")
+
+    sys.stdout.write("".join(buf))
+    sys.stdout.flush()
 
 
 def print_backtest_results(table_rows: list) -> None:
     """Print the backtest results in a nicely formatted table"""
-    # Clear the screen
-    os.system("cls" if os.name == "nt" else "clear")
+    from tabulate import tabulate
+
+    # Clear the screen with the ANSI erase + home sequence instead of
+    # shelling out to cls/clear for every redraw
+    sys.stdout.write("\033[2J\033[H")
 
-    # Split rows into ticker rows and summary rows
+    # Split out ticker rows and grab the latest summary in the same pass.
+    # format_backtest_row tags each row with its is_summary flag, so no
+    # per-row string scan is needed. The backtester prepends each new day's
+    # rows, so the first summary row encountered is the most recent one.
     ticker_rows = []
-    summary_rows = []
+    latest_summary = None
 
-    for row in table_rows:
-        if isinstance(row[1], str) and "PORTFOLIO SUMMARY" in row[1]:
-            summary_rows.append(row)
+    for is_summary, row in table_rows:
+        if is_summary:
+            if latest_summary is None:
+                latest_summary = row
         else:
             ticker_rows.append(row)
 
+    # Accumulate the whole frame and emit it with a single write below
+    buf = []
+
     # Display latest portfolio summary
-    if summary_rows:
-        # Pick the most recent summary by date (YYYY-MM-DD)
-        latest_summary = max(summary_rows, key=lambda r: r[0])
-        print(f"\n{Fore.WHITE}{Style.BRIGHT}PORTFOLIO SUMMARY:{Style.RESET_ALL}")
+    if latest_summary is not None:
+        buf.append(f"\n{Fore.WHITE}{Style.BRIGHT}PORTFOLIO SUMMARY:{Style.RESET_ALL}\n")
 
-        # Adjusted indexes after adding Long/Short Shares
-        position_str = latest_summary[7].split("$")[1].split(Style.RESET_ALL)[0].replace(",", "")
-        cash_str     = latest_summary[8].split("$")[1].split(Style.RESET_ALL)[0].replace(",", "")
-        total_str    = latest_summary[9].split("$")[1].split(Style.RESET_ALL)[0].replace(",", "")
+        # Raw values carried on the summary row by format_backtest_row, so the
+        # colored display strings never need to be parsed back apart
+        position_value, cash_balance, total_value = latest_summary[14:17]
 
-        print(f"Cash Balance: {Fore.CYAN}${float(cash_str):,.2f}{Style.RESET_ALL}")
-        print(f"Total Position Value: {Fore.YELLOW}${float(position_str):,.2f}{Style.RESET_ALL}")
-        print(f"Total Value: {Fore.WHITE}${float(total_str):,.2f}{Style.RESET_ALL}")
-        print(f"Return: {latest_summary[10]}")
+        buf.append(f"Cash Balance: {Fore.CYAN}${cash_balance:,.2f}{Style.RESET_ALL}\n")
+        buf.append(f"Total Position Value: {Fore.YELLOW}${position_value:,.2f}{Style.RESET_ALL}\n")
+        buf.append(f"Total Value: {Fore.WHITE}${total_value:,.2f}{Style.RESET_ALL}\n")
+        buf.append(f"Return: {latest_summary[10]}\n")
 
         # Display performance metrics if available
         if latest_summary[11]:  # Sharpe ratio
-            print(f"Sharpe Ratio: {latest_summary[11]}")
+            buf.append(f"Sharpe Ratio: {latest_summary[11]}\n")
         if latest_summary[12]:  # Sortino ratio
-            print(f"Sortino Ratio: {latest_summary[12]}")
+            buf.append(f"Sortino Ratio: {latest_summary[12]}\n")
         if latest_summary[13]:  # Max drawdown
-            print(f"Max Drawdown: {latest_summary[13]}")
+            buf.append(f"Max Drawdown: {latest_summary[13]}\n")
 
     # Add vertical spacing
-    print("\n" * 2)
+    buf.append("\n" * 3)
 
-    # Print the table with just ticker rows
-    print(
-        tabulate(
-            ticker_rows,
-            headers=[
-                "Date",
-                "Ticker",
-                "Action",
-                "Quantity",
-                "Price",
-                "Long Shares",
-                "Short Shares",
-                "Position Value",
-                "Bullish",
-                "Bearish",
-                "Neutral",
-            ],
-            tablefmt="grid",
-            colalign=(
-                "left",    # Date
-                "left",    # Ticker
-                "center",  # Action
-                "right",   # Quantity
-                "right",   # Price
-                "right",   # Long Shares
-                "right",   # Short Shares
-                "right",   # Position Value
-                "right",   # Bullish
-                "right",   # Bearish
-                "right",   # Neutral
-            ),
+    # Print the table with just ticker rows; very large backtests use the
+    # single-pass renderer instead of tabulate's multi-pass layout
+    if len(ticker_rows) > LARGE_TABLE_THRESHOLD:
+        buf.append(render_grid(BACKTEST_TABLE_HEADERS, ticker_rows, BACKTEST_TABLE_COLALIGN) + "\n")
+    else:
+        buf.append(
+            tabulate(
+                ticker_rows,
+                headers=BACKTEST_TABLE_HEADERS,
+                tablefmt="grid",
+                colalign=BACKTEST_TABLE_COLALIGN,
+            )
+            + "\n"
         )
-    )
 
     # Add vertical spacing
-    print("\n" * 4)
+    buf.append("\n" * 5)
+
+    sys.stdout.write("".join(buf))
+    sys.stdout.flush()
 
 
 def format_backtest_row(
@@ -326,20 +456,19 @@ def format_backtest_row(
     sharpe_ratio: float = None,
     sortino_ratio: float = None,
     max_drawdown: float = None,
-) -> list[any]:
-    """Format a row for the backtest results table"""
-    # Color the action
-    action_color = {
-        "BUY": Fore.GREEN,
-        "COVER": Fore.GREEN,
-        "SELL": Fore.RED,
-        "SHORT": Fore.RED,
-        "HOLD": Fore.WHITE,
-    }.get(action.upper(), Fore.WHITE)
+) -> tuple[bool, list[any]]:
+    """Format a row for the backtest results table.
+
+    Returns an (is_summary, row) pair so print_backtest_results can
+    partition rows without inspecting cell contents.
+    """
+    # Upper-case once for both the color lookup and the displayed cell
+    action = action.upper()
+    action_color = BACKTEST_ACTION_COLORS.get(action, Fore.WHITE)
 
     if is_summary:
         return_color = Fore.GREEN if return_pct >= 0 else Fore.RED
-        return [
+        return True, [
             date,
             f"{Fore.WHITE}{Style.BRIGHT}PORTFOLIO SUMMARY{Style.RESET_ALL}",
             "",  # Action
@@ -354,18 +483,25 @@ def format_backtest_row(
             f"{Fore.YELLOW}{sharpe_ratio:.2f}{Style.RESET_ALL}" if sharpe_ratio is not None else "",  # Sharpe Ratio
             f"{Fore.YELLOW}{sortino_ratio:.2f}{Style.RESET_ALL}" if sortino_ratio is not None else "",  # Sortino Ratio
             f"{Fore.RED}{abs(max_drawdown):.2f}%{Style.RESET_ALL}" if max_drawdown is not None else "",  # Max Drawdown
+            # Raw values appended so print_backtest_results doesn't reparse the
+            # colored strings above; summary rows never reach tabulate
+            total_position_value,  # Raw Total Position Value
+            cash_balance,  # Raw Cash Balance
+            total_value,  # Raw Total Value
         ]
     else:
-        return [
+        # Cells drawn from small repeating domains go through the colorize
+        # cache; continuously varying values stay as plain f-strings
+        return False, [
             date,
-            f"{Fore.CYAN}{ticker}{Style.RESET_ALL}",
-            f"{action_color}{action.upper()}{Style.RESET_ALL}",
-            f"{action_color}{quantity:,.0f}{Style.RESET_ALL}",
-            f"{Fore.WHITE}{price:,.2f}{Style.RESET_ALL}",
-            f"{Fore.GREEN}{long_shares:,.0f}{Style.RESET_ALL}",   # Long Shares
-            f"{Fore.RED}{short_shares:,.0f}{Style.RESET_ALL}",    # Short Shares
-            f"{Fore.YELLOW}{position_value:,.2f}{Style.RESET_ALL}",
-            f"{Fore.GREEN}{bullish_count}{Style.RESET_ALL}",
-            f"{Fore.RED}{bearish_count}{Style.RESET_ALL}",
-            f"{Fore.BLUE}{neutral_count}{Style.RESET_ALL}",
+            colorize(Fore.CYAN, ticker),
+            colorize(action_color, action),
+            colorize(action_color, f"{quantity:,.0f}"),
+            f"{Fore.WHITE}{price:,.2f}{RESET}",
+            colorize(Fore.GREEN, f"{long_shares:,.0f}"),   # Long Shares
+            colorize(Fore.RED, f"{short_shares:,.0f}"),    # Short Shares
+            f"{Fore.YELLOW}{position_value:,.2f}{RESET}",
+            colorize(Fore.GREEN, str(bullish_count)),
+            colorize(Fore.RED, str(bearish_count)),
+            colorize(Fore.BLUE, str(neutral_count)),
         ]
@@ -2,7 +2,7 @@
 
 import json
 from pydantic import BaseModel
-from src.llm.models import get_model, get_model_info
+from src.llm.models import ModelProvider, get_model, get_model_info
 from src.utils.progress import progress
 from src.graph.state import AgentState
 
@@ -121,6 +121,13 @@ def extract_json_from_response(content: str) -> dict | None:
     return None
 
 
+def provider_value(model_provider) -> str:
+    """Normalize a provider that may be a ModelProvider member or a plain string."""
+    if isinstance(model_provider, ModelProvider):
+        return model_provider.value
+    return str(model_provider)
+
+
 def get_agent_model_config(state, agent_name):
     """
     Get model configuration for a specific agent from the state.
@@ -134,14 +141,10 @@ def get_agent_model_config(state, agent_name):
         model_name, model_provider = request.get_agent_model_config(agent_name)
         # Ensure we have valid values
         if model_name and model_provider:
-            return model_name, model_provider.value if hasattr(model_provider, 'value') else str(model_provider)
-    
+            return model_name, provider_value(model_provider)
+
     # Fall back to global configuration (system defaults)
     model_name = state.get("metadata", {}).get("model_name") or "gpt-4.1"
     model_provider = state.get("metadata", {}).get("model_provider") or "OPENAI"
-    
-    # Convert enum to string if necessary
-    if hasattr(model_provider, 'value'):
-        model_provider = model_provider.value
-    
-    return model_name, model_provider
+
+    return model_name, provider_value(model_provider)
@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from functools import lru_cache
 from rich.console import Console
 from rich.live import Live
 from rich.table import Table
@@ -8,6 +9,23 @@ from typing import Dict, Optional, Callable, List
 
 console = Console()
 
+# Status styles are fixed, so build them once instead of per row on every refresh
+DONE_STYLE = Style(color="green", bold=True)
+ERROR_STYLE = Style(color="red", bold=True)
+IN_PROGRESS_STYLE = Style(color="yellow")
+AGENT_NAME_STYLE = Style(bold=True)
+TICKER_STYLE = Style(color="cyan")
+
+
+@lru_cache(maxsize=None)
+def _display_name(agent_name: str) -> str:
+    """Convert agent_name to a display-friendly format.
+
+    Cached: the agent-name set is tiny and fixed, and this runs for every
+    row on every refresh.
+    """
+    return agent_name.replace("_agent", "").replace("_", " ").title()
+
 
 class AgentProgress:
     """Manages progress tracking for multiple agents."""
@@ -69,7 +87,7 @@ class AgentProgress:
 
     def _get_display_name(self, agent_name: str) -> str:
         """Convert agent_name to a display-friendly format."""
-        return agent_name.replace("_agent", "").replace("_", " ").title()
+        return _display_name(agent_name)
 
     def _refresh_display(self):
         """Refresh the progress display."""
@@ -90,23 +108,24 @@ class AgentProgress:
             status = info["status"]
             ticker = info["ticker"]
             # Create the status text with appropriate styling
-            if status.lower() == "done":
-                style = Style(color="green", bold=True)
+            status_lower = status.lower()
+            if status_lower == "done":
+                style = DONE_STYLE
                 symbol = "✓"
-            elif status.lower() == "error":
-                style = Style(color="red", bold=True)
+            elif status_lower == "error":
+                style = ERROR_STYLE
                 symbol = "✗"
             else:
-                style = Style(color="yellow")
+                style = IN_PROGRESS_STYLE
                 symbol = "⋯"
 
             agent_display = self._get_display_name(agent_name)
             status_text = Text()
             status_text.append(f"{symbol} ", style=style)
-            status_text.append(f"{agent_display:<20}", style=Style(bold=True))
+            status_text.append(f"{agent_display:<20}", style=AGENT_NAME_STYLE)
 
             if ticker:
-                status_text.append(f"[{ticker}] ", style=Style(color="cyan"))
+                status_text.append(f"[{ticker}] ", style=TICKER_STYLE)
             status_text.append(status, style=style)
 
             self.table.add_row(status_text)